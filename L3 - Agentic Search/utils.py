@@ -15,8 +15,8 @@ easy to reason about while still being faithful to the official game rules:
 * Repeated letters are allowed.
 
 To keep the branching factor manageable for search, we pre-filter a word list
-and retain only entries that are feasible under the given rules.  We also
-precompute all valid prefixes so that the successor generator can prune branches
+and retain only entries that are feasible under the given rules.  The surviving
+words are stored in a trie so that the successor generator can prune branches
 that can no longer lead to a valid solution.
 
 Example
@@ -40,12 +40,25 @@ point ``dictionary_path`` at a richer corpus.
 from __future__ import annotations
 
 import asyncio
+import functools
 import heapq
 import inspect
+from collections import deque
 from dataclasses import dataclass, field
 from itertools import count
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 __all__ = ["SpellingBeeProblem", "SearchResult", "generalized_search"]
 
@@ -112,9 +125,22 @@ _FALLBACK_WORDS: Set[str] = {
 }
 
 
+@functools.lru_cache(maxsize=8)
+def _read_word_file(path: str, mtime: float) -> FrozenSet[str]:
+    """Parse a newline-delimited word file.
+
+    Cached on ``(path, mtime)`` so notebooks that build many puzzles only read
+    the dictionary once, while edits to the file still invalidate the entry.
+    """
+
+    with open(path, "r", encoding="utf-8") as handle:
+        return frozenset(line.strip().upper() for line in handle if line.strip())
+
+
 def _load_word_list(
-    dictionary: Optional[Iterable[str]] = None, dictionary_path: Optional[Path] = None
-) -> Set[str]:
+    dictionary: Optional[Iterable[str]] = None,
+    dictionary_path: Optional[Path | str] = None,
+) -> FrozenSet[str]:
     """Load a candidate dictionary.
 
     Parameters
@@ -126,18 +152,18 @@ def _load_word_list(
 
     Returns
     -------
-    set of uppercase words without surrounding whitespace.
+    frozenset of uppercase words without surrounding whitespace.  Word files
+    are parsed once and shared between calls (see ``_read_word_file``).
     """
 
     if dictionary is not None:
-        return {str(word).strip().upper() for word in dictionary if word}
+        return frozenset(str(word).strip().upper() for word in dictionary if word)
 
     if dictionary_path is not None:
         path = Path(dictionary_path)
         if not path.is_file():
             raise FileNotFoundError(f"Dictionary path does not exist: {path}")
-        with path.open("r", encoding="utf-8") as handle:
-            return {line.strip().upper() for line in handle if line.strip()}
+        return _read_word_file(str(path.resolve()), path.stat().st_mtime)
 
     default_candidates: Tuple[Path, ...] = (
         Path("/usr/share/dict/words"),
@@ -147,11 +173,10 @@ def _load_word_list(
 
     for candidate in default_candidates:
         if candidate.is_file():
-            with candidate.open("r", encoding="utf-8") as handle:
-                return {line.strip().upper() for line in handle if line.strip()}
+            return _read_word_file(str(candidate.resolve()), candidate.stat().st_mtime)
 
     # Nothing else available – fall back to the bundled miniature list.
-    return set(_FALLBACK_WORDS)
+    return frozenset(_FALLBACK_WORDS)
 
 
 # ---------------------------------------------------------------------------
@@ -159,25 +184,40 @@ def _load_word_list(
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+# The word trie is stored flat: nodes are integer ids assigned breadth-first,
+# ``_trie_edges[node]`` holds that node's ``(letter, child_prefix, child_id)``
+# edges in puzzle order and ``_trie_terminal[node]`` flags complete words.
+# Expanding a node is a single list index that returns ready-made successor
+# tuples, and no per-node Python objects or dicts are kept after construction.
+_TrieEdge = Tuple[str, str, int]
+_TRIE_ROOT = 0
+
+
+@dataclass(frozen=True, slots=True)
 class SearchResultMetadata:
     """Small helper container for search-related metadata.
 
-    The generalized search implementation provided to students may choose to
-    stash additional metadata alongside each state (for example, whether the
-    word is a pangram). Exposing a typed container keeps the interface tidy
+    Code built on top of ``SpellingBeeProblem`` may choose to stash
+    additional metadata alongside each state (for example, whether the word
+    is a pangram). Exposing a typed container keeps the interface tidy
     without committing us to a concrete implementation in this lab.  The
-    ``SpellingBeeProblem`` currently sets this to ``None`` in successor tuples,
-    but the attribute is defined for completeness and future extension.
+    ``SpellingBeeProblem`` currently sets this to ``None`` in successor
+    tuples.  ``generalized_search`` expands states from the problem's trie
+    rather than through ``successors``, so its ``SearchNode.metadata`` is
+    always ``None``; filling it in means changing the search engine too.
     """
 
     is_pangram: bool = False
     score: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchNode:
-    """Represents a node in the search frontier."""
+    """Represents a node in the search frontier.
+
+    Slotted because searches can allocate hundreds of thousands of nodes, and
+    dropping the per-instance ``__dict__`` roughly halves their footprint.
+    """
 
     state: str
     parent: Optional["SearchNode"]
@@ -185,6 +225,8 @@ class SearchNode:
     path_cost: float
     heuristic: float = 0.0
     metadata: Optional[SearchResultMetadata] = None
+    trie_node: Optional[int] = None
+    depth: int = 0
 
     def total_cost(self) -> float:
         return self.path_cost + self.heuristic
@@ -251,12 +293,18 @@ class SpellingBeeProblem:
             raise ValueError("Minimum word length must be positive")
 
         self._letters: Tuple[str, ...] = normalized_letters
-        self._letter_set: Set[str] = set(normalized_letters)
+        # The letters as one string let ``str.strip`` test "only allowed
+        # letters" in C, with this puzzle's letters baked into the argument.
+        self._allowed_letters: str = "".join(normalized_letters)
         self._required_letter: str = normalized_required
         self._min_word_length: int = min_word_length
 
-        if isinstance(dictionary_path, str):
-            dictionary_path = Path(dictionary_path)
+        # Each allowed letter owns one bit so pangram checks reduce to comparing
+        # small integers instead of building and comparing sets.
+        self._letter_index: Dict[str, int] = {
+            letter: index for index, letter in enumerate(normalized_letters)
+        }
+        self._full_mask: int = (1 << len(normalized_letters)) - 1
 
         raw_dictionary = _load_word_list(
             dictionary=dictionary, dictionary_path=dictionary_path
@@ -264,9 +312,9 @@ class SpellingBeeProblem:
         if not raw_dictionary:
             raise ValueError("Dictionary must contain at least one word")
 
-        self._valid_words: Set[str] = {
-            word for word in raw_dictionary if self._is_candidate_word(word)
-        }
+        self._valid_words: FrozenSet[str] = frozenset(
+            self._filter_candidates(raw_dictionary)
+        )
 
         if not self._valid_words:
             raise ValueError(
@@ -274,13 +322,26 @@ class SpellingBeeProblem:
             )
 
         self._max_word_length: int = max(len(word) for word in self._valid_words)
-        self._prefixes: Set[str] = self._build_prefix_set(self._valid_words)
-        self._pangrams: Set[str] = {
-            word for word in self._valid_words if self.is_pangram(word)
+        self._trie_edges: List[Tuple[_TrieEdge, ...]]
+        self._trie_terminal: bytearray
+        self._trie_edges, self._trie_terminal = self._build_trie(
+            self._valid_words, self._letters
+        )
+        self._word_masks: Dict[str, int] = {
+            word: self._letter_mask(word) for word in self._valid_words
         }
+        self._pangrams: FrozenSet[str] = frozenset(
+            word
+            for word, mask in self._word_masks.items()
+            if self._is_pangram_mask(mask)
+        )
 
-        # Include the empty string so the very first expansion is permitted.
-        self._prefixes.add("")
+        # Scores are fixed for the lifetime of the puzzle (see ``score_word``),
+        # so compute them once rather than re-validating on every call.
+        self._scores: Dict[str, int] = {}
+        for word in self._valid_words:
+            base = 1 if len(word) == 4 else len(word)
+            self._scores[word] = base + (7 if word in self._pangrams else 0)
 
     # ------------------------------------------------------------------
     # Public constructor helpers
@@ -327,12 +388,16 @@ class SpellingBeeProblem:
         return self._min_word_length
 
     @property
-    def valid_words(self) -> Set[str]:
-        return set(self._valid_words)
+    def valid_words(self) -> FrozenSet[str]:
+        """Return every valid word; immutable, so no defensive copy is made."""
+
+        return self._valid_words
 
     @property
-    def pangrams(self) -> Set[str]:
-        return set(self._pangrams)
+    def pangrams(self) -> FrozenSet[str]:
+        """Return the valid words that use every letter (immutable)."""
+
+        return self._pangrams
 
     @property
     def max_word_length(self) -> int:
@@ -350,21 +415,22 @@ class SpellingBeeProblem:
 
         Returns a list of ``(action, next_state, metadata)`` tuples, mirroring
         the pattern often used in search textbooks.  The metadata element is
-        optional - we currently return ``None`` to keep things simple - but the
-        slot is present so students can extend it without modifying the search
-        engine.
+        optional - we currently return ``None`` to keep things simple.
+
+        ``generalized_search`` does not call this method: it walks the same
+        trie edges directly, so overriding ``successors`` (or ``is_goal``) in
+        a subclass does not change what the search expands.
         """
 
         normalized_state = self._normalize_word(state)
-        if len(normalized_state) >= self._max_word_length:
+        node = self._find_node(normalized_state)
+        if node is None:
             return []
 
-        successors: List[Tuple[str, str, Optional[SearchResultMetadata]]] = []
-        for letter in self._letters:
-            next_state = normalized_state + letter
-            if next_state in self._prefixes:
-                successors.append((letter, next_state, None))
-        return successors
+        return [
+            (letter, next_state, None)
+            for letter, next_state, _child in self._trie_edges[node]
+        ]
 
     def is_goal(self, state: str) -> bool:
         """Check whether ``state`` constitutes a goal word under puzzle rules."""
@@ -380,7 +446,7 @@ class SpellingBeeProblem:
         """Return ``True`` if *word* is comprised solely of permitted letters."""
 
         normalized = self._normalize_word(word)
-        return bool(normalized) and set(normalized).issubset(self._letter_set)
+        return bool(normalized) and not normalized.strip(self._allowed_letters)
 
     def contains_required_letter(self, word: str) -> bool:
         """Return ``True`` if *word* includes the required letter."""
@@ -390,20 +456,18 @@ class SpellingBeeProblem:
     def is_valid_word(self, word: str) -> bool:
         """Return ``True`` if *word* satisfies all puzzle constraints."""
 
-        normalized = self._normalize_word(word)
-        if len(normalized) < self._min_word_length:
-            return False
-        if not self.contains_only_allowed_letters(normalized):
-            return False
-        if self._required_letter not in normalized:
-            return False
-        return normalized in self._valid_words
+        # ``_valid_words`` only holds words that passed every rule at
+        # construction, so membership alone answers the question.
+        return self._normalize_word(word) in self._valid_words
 
     def is_pangram(self, word: str) -> bool:
         """Return ``True`` if *word* uses every provided letter at least once."""
 
         normalized = self._normalize_word(word)
-        return self._letter_set.issubset(set(normalized))
+        mask = self._word_masks.get(normalized)
+        if mask is None:
+            mask = self._letter_mask(normalized)
+        return self._is_pangram_mask(mask)
 
     def score_word(self, word: str) -> int:
         """Compute the official Spelling Bee score for *word*.
@@ -414,28 +478,32 @@ class SpellingBeeProblem:
                 * Pangrams receive a 7-point bonus on top of their length score.
         """
 
-        normalized = self._normalize_word(word)
-        if not self.is_valid_word(normalized):
+        score = self._scores.get(self._normalize_word(word))
+        if score is None:
             raise ValueError(f"Word is not valid in this puzzle: {word}")
-
-        base = 1 if len(normalized) == 4 else len(normalized)
-        return base + (7 if self.is_pangram(normalized) else 0)
+        return score
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _is_candidate_word(self, word: str) -> bool:
-        normalized = self._normalize_word(word)
-        if len(normalized) < self._min_word_length:
-            return False
-        if not normalized.isalpha():
-            return False
-        if self._required_letter not in normalized:
-            return False
-        if not set(normalized).issubset(self._letter_set):
-            return False
-        return True
+    def _filter_candidates(self, words: Iterable[str]) -> Set[str]:
+        """Keep the (already normalized) *words* that satisfy the puzzle rules.
+
+        ``word.strip(allowed)`` removes every allowed letter from both ends, so
+        it is empty exactly when the word uses nothing else.  This keeps the
+        per-word work inside C string routines instead of building a set for
+        each of the (potentially 100k+) dictionary entries.
+        """
+
+        allowed = self._allowed_letters
+        required = self._required_letter
+        min_length = self._min_word_length
+        return {
+            word
+            for word in words
+            if len(word) >= min_length and required in word and not word.strip(allowed)
+        }
 
     @staticmethod
     def _normalize_letter(letter: str) -> str:
@@ -447,13 +515,68 @@ class SpellingBeeProblem:
     def _normalize_word(word: str) -> str:
         return str(word or "").strip().upper()
 
+    def _letter_mask(self, word: str) -> int:
+        """Return the bitmask of puzzle letters used by *word*.
+
+        Letters outside the puzzle are ignored, so the mask only answers which
+        of the allowed letters appear.
+        """
+
+        mask = 0
+        letter_index = self._letter_index
+        for letter in word:
+            index = letter_index.get(letter)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    def _is_pangram_mask(self, mask: int) -> bool:
+        return mask == self._full_mask
+
     @staticmethod
-    def _build_prefix_set(words: Iterable[str]) -> Set[str]:
-        prefixes: Set[str] = set()
+    def _build_trie(
+        words: Set[str], letters: Sequence[str]
+    ) -> Tuple[List[Tuple[_TrieEdge, ...]], bytearray]:
+        nested: Dict[str, dict] = {}
         for word in words:
-            for end in range(1, len(word) + 1):
-                prefixes.add(word[:end])
-        return prefixes
+            node = nested
+            for letter in word:
+                node = node.setdefault(letter, {})
+
+        # Flatten breadth-first: ids are handed out in the order nodes are
+        # queued, which is also the order they are popped, so ``edges[i]``
+        # always describes node ``i``.  Visiting letters in puzzle order keeps
+        # expansion deterministic regardless of the dictionary's order.
+        edges: List[Tuple[_TrieEdge, ...]] = []
+        terminal = bytearray()
+        queue = deque([("", nested)])
+        next_id = _TRIE_ROOT + 1
+        while queue:
+            prefix, node = queue.popleft()
+            node_edges = []
+            for letter in letters:
+                child = node.get(letter)
+                if child is not None:
+                    child_prefix = prefix + letter
+                    node_edges.append((letter, child_prefix, next_id))
+                    queue.append((child_prefix, child))
+                    next_id += 1
+            edges.append(tuple(node_edges))
+            terminal.append(prefix in words)
+        return edges, terminal
+
+    def _find_node(self, state: str) -> Optional[int]:
+        """Return the trie node id reached by *state*, or ``None`` if absent."""
+
+        node = _TRIE_ROOT
+        for letter in state:
+            for edge_letter, _prefix, child in self._trie_edges[node]:
+                if edge_letter == letter:
+                    node = child
+                    break
+            else:
+                return None
+        return node
 
     # ------------------------------------------------------------------
     # Representations
@@ -482,6 +605,8 @@ async def generalized_search(
     heuristic_fn: Union[Callable[[str], float], Callable[[str], asyncio.coroutine]],
     strategy: str = "a_star",
     max_expansions: Optional[int] = None,
+    heuristic_cache: Optional[Dict[str, float]] = None,
+    max_concurrency: Optional[int] = None,
     verbose: bool = False,
 ) -> SearchResult:
     """Generic best-first search over ``SpellingBeeProblem`` states.
@@ -489,8 +614,12 @@ async def generalized_search(
     Parameters
     ----------
     problem:
-        Instance that provides ``initial_state()``, ``successors(state)`` and
-        ``is_goal(state)``.
+        ``SpellingBeeProblem`` instance to search.  Nodes are expanded by
+        walking the problem's word trie: each frontier entry carries its trie
+        node, so successors and goal tests never re-resolve the state string.
+        The problem's ``successors`` and ``is_goal`` methods are not called,
+        which means subclasses cannot customize the search by overriding
+        them, and every ``SearchNode.metadata`` is ``None``.
     cost_fn:
         Callable returning the incremental cost ``g(parent_state, action, child_state)``.
     heuristic_fn:
@@ -501,25 +630,45 @@ async def generalized_search(
         heuristic and behaves like UCS.
     max_expansions:
         Optional safety limit to prevent unbounded work.
+    heuristic_cache:
+        Optional ``state -> h(state)`` mapping consulted before and filled after
+        every heuristic evaluation.  Pass the same dict to repeated searches
+        that share a ``heuristic_fn`` so states are never scored twice, which
+        matters when each evaluation is an LLM call.
+    max_concurrency:
+        Optional cap on in-flight calls to an async ``heuristic_fn``.  By
+        default successors are scored one at a time.  When set, the
+        successors of each expanded node are scored concurrently with
+        ``asyncio.gather``, at most this many at once, so ``heuristic_fn``
+        must then be safe to run concurrently (e.g. not share agents whose
+        conversation state would mix evaluations of different states).
     """
 
     strategy = strategy.lower()
     if strategy not in {"a_star", "uniform_cost"}:
         raise ValueError("strategy must be 'a_star' or 'uniform_cost'")
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be positive")
 
     initial_state = problem.initial_state()
 
     # Check if heuristic_fn is async
     is_async_heuristic = inspect.iscoroutinefunction(heuristic_fn)
+    use_heuristic = strategy == "a_star"
+    if heuristic_cache is None:
+        heuristic_cache = {}
 
     try:
-        if strategy == "a_star":
+        if not use_heuristic:
+            initial_heuristic = 0.0
+        elif initial_state in heuristic_cache:
+            initial_heuristic = heuristic_cache[initial_state]
+        else:
             if is_async_heuristic:
                 initial_heuristic = float(await heuristic_fn(initial_state))
             else:
                 initial_heuristic = float(heuristic_fn(initial_state))
-        else:
-            initial_heuristic = 0.0
+            heuristic_cache[initial_state] = initial_heuristic
     except Exception as exc:  # pragma: no cover - propagate context
         raise RuntimeError(
             "heuristic_fn raised an exception for the initial state"
@@ -532,62 +681,105 @@ async def generalized_search(
         path_cost=0.0,
         heuristic=initial_heuristic,
         metadata=None,
+        trie_node=_TRIE_ROOT,
     )
 
     frontier: List[Tuple[float, int, SearchNode]] = []
     counter = count()
     heapq.heappush(frontier, (root.total_cost(), next(counter), root))
 
-    best_costs: Dict[str, float] = {initial_state: 0.0}
-    explored: Set[str] = set()
+    # The state space is the word trie, which is a tree: every node has a
+    # single parent, so it is pushed at most once (when that parent is
+    # expanded) and popped at most once.  No explored set, best-cost table or
+    # stale-entry check is needed, and every non-goal pop is an expansion.
     expansions = 0
 
+    semaphore = (
+        asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+    )
+
+    async def evaluate_async(state: str) -> float:
+        try:
+            if semaphore is None:
+                return float(await heuristic_fn(state))
+            async with semaphore:
+                return float(await heuristic_fn(state))
+        except Exception as exc:
+            raise RuntimeError(
+                f"heuristic_fn raised an exception for state {state!r}"
+            ) from exc
+
+    def evaluate_sync(state: str) -> float:
+        try:
+            return float(heuristic_fn(state))
+        except Exception as exc:
+            raise RuntimeError(
+                f"heuristic_fn raised an exception for state {state!r}"
+            ) from exc
+
+    # Bind hot-loop lookups to locals once; the loop below may run for
+    # hundreds of thousands of expansions.
+    push = heapq.heappush
+    pop = heapq.heappop
+    trie_edges = problem._trie_edges
+    trie_terminal = problem._trie_terminal
+    expansion_limit = float("inf") if max_expansions is None else max_expansions
+
     while frontier:
-        if max_expansions is not None and expansions >= max_expansions:
+        if expansions >= expansion_limit:
             break
 
-        _, _, node = heapq.heappop(frontier)
+        _, _, node = pop(frontier)
 
-        if problem.is_goal(node.state):
+        if trie_terminal[node.trie_node]:
             return _build_search_result(
                 node,
                 success=True,
                 expansions=expansions,
-                explored=len(explored),
+                explored=expansions,
                 frontier_size=len(frontier),
             )
 
-        if node.state in explored:
-            continue
-
-        explored.add(node.state)
         expansions += 1
 
-        for action, next_state, _metadata in problem.successors(node.state):
-            step_cost = float(cost_fn(node.state, action, next_state))
+        parent_state = node.state
+        parent_cost = node.path_cost
+
+        # Cost every successor first so async heuristics can score them as a
+        # single batch when ``max_concurrency`` allows it.
+        candidates: List[Tuple[str, str, int, float, float]] = []
+        for action, next_state, child_node in trie_edges[node.trie_node]:
+            step_cost = float(cost_fn(parent_state, action, next_state))
             if step_cost < 0:
                 raise ValueError("cost_fn must return non-negative values")
 
-            new_cost = node.path_cost + step_cost
-            if next_state in best_costs and new_cost >= best_costs[next_state]:
-                continue
+            candidates.append(
+                (action, next_state, child_node, step_cost, parent_cost + step_cost)
+            )
 
-            try:
-                if strategy == "a_star":
-                    if is_async_heuristic:
-                        heuristic_value = float(await heuristic_fn(next_state))
-                    else:
-                        heuristic_value = float(heuristic_fn(next_state))
+        if use_heuristic:
+            pending = [
+                candidate[1]
+                for candidate in candidates
+                if candidate[1] not in heuristic_cache
+            ]
+            if pending:
+                if is_async_heuristic and semaphore is not None:
+                    values = await asyncio.gather(
+                        *(evaluate_async(state) for state in pending)
+                    )
+                elif is_async_heuristic:
+                    values = [await evaluate_async(state) for state in pending]
                 else:
-                    heuristic_value = 0.0
-            except Exception as exc:
-                raise RuntimeError(
-                    f"heuristic_fn raised an exception for state {next_state!r}"
-                ) from exc
+                    values = [evaluate_sync(state) for state in pending]
+                heuristic_cache.update(zip(pending, values))
+
+        for action, next_state, child_node, step_cost, new_cost in candidates:
+            heuristic_value = heuristic_cache[next_state] if use_heuristic else 0.0
 
             if verbose:
                 if len(next_state) > 4:
-                    print(f"Expanding: {node.state!r} + {action!r} -> {next_state!r}")
+                    print(f"Expanding: {parent_state!r} + {action!r} -> {next_state!r}")
                     print(f"  Step cost: {step_cost}")
                     print(f"  New cost: {new_cost}")
                     print(f"  Heuristic score: {heuristic_value}")
@@ -598,17 +790,18 @@ async def generalized_search(
                 action=action,
                 path_cost=new_cost,
                 heuristic=heuristic_value,
-                metadata=_metadata,
+                metadata=None,
+                trie_node=child_node,
+                depth=node.depth + 1,
             )
 
-            best_costs[next_state] = new_cost
-            heapq.heappush(frontier, (child.total_cost(), next(counter), child))
+            push(frontier, (new_cost + heuristic_value, next(counter), child))
 
     return _build_search_result(
         node=None,
         success=False,
         expansions=expansions,
-        explored=len(explored),
+        explored=expansions,
         frontier_size=len(frontier),
     )
 
@@ -645,10 +838,10 @@ def _build_search_result(
 
 
 def _reconstruct_actions(node: SearchNode) -> List[str]:
-    actions: List[str] = []
-    cursor: Optional[SearchNode] = node
-    while cursor and cursor.action is not None:
-        actions.append(cursor.action)
+    # The path length is known up front, so fill the actions back to front.
+    actions: List[str] = [""] * node.depth
+    cursor = node
+    for index in range(node.depth - 1, -1, -1):
+        actions[index] = cursor.action
         cursor = cursor.parent
-    actions.reverse()
     return actions
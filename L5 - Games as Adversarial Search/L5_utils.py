@@ -1,7 +1,10 @@
+import asyncio
+import functools
 import random
 import time
-from typing import List, Tuple, Dict, Optional
-from itertools import permutations
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Tuple, Dict, FrozenSet, Optional, Set
 
 LETTER_VALUES: Dict[str, int] = {
     "A": 1,
@@ -54,14 +57,173 @@ PREMIUM_BOARD = [
     [2, 0, 0, 0, 0, 3, 0, 0, 0, 3, 0, 0, 0, 0, 2],
     [0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0],
 ]
+# Row-major flattening of PREMIUM_BOARD, indexed by row * BOARD_SIZE + col, so
+# hot scoring loops do a single bytes lookup instead of two list lookups
+PREMIUM_FLAT = bytes(premium for row in PREMIUM_BOARD for premium in row)
+# Per-square multipliers for a newly placed tile, laid out like PREMIUM_FLAT
+LETTER_MULTIPLIERS = bytes({2: 2, 3: 3}.get(premium, 1) for premium in PREMIUM_FLAT)
+WORD_MULTIPLIERS = bytes({4: 2, 5: 3}.get(premium, 1) for premium in PREMIUM_FLAT)
+
+# The board is a bytearray laid out like PREMIUM_FLAT, holding EMPTY or the code
+# ord(letter) - TILE_OFFSET of the tile on each square (1..26 for A..Z)
+EMPTY = 0
+TILE_OFFSET = 64
+
+# Zobrist hashing: one random 64-bit key per (square, tile code) pair, indexed
+# by square * ZOBRIST_CODES + code, XORed together over the tiles on the board,
+# plus a key XORed in while player 2 is to move. Drawn from a private generator
+# so that seeding `random` for a game still reproduces it.
+ZOBRIST_CODES = 32  # tile codes are 1..26, and 31 for a blank
+_zobrist_random = random.Random(480)
+ZOBRIST_TILE_KEYS = [
+    _zobrist_random.getrandbits(64) for _ in range(BOARD_SIZE**2 * ZOBRIST_CODES)
+]
+ZOBRIST_PLAYER_KEY = _zobrist_random.getrandbits(64)
+
+
+@functools.cache
+def _dictionary() -> FrozenSet[str]:
+    """Loads the word list that sits next to this module, once, on first use."""
+    with Path(__file__).with_name("words.txt").open() as f:
+        return frozenset(word.strip().upper() for word in f if len(word.strip()) >= 2)
 
-with open("./words.txt") as f:
-    DICTIONARY = set(word.strip().upper() for word in f if len(word.strip()) >= 2)
 
+def __getattr__(name: str):
+    # DICTIONARY used to be read at import time; keep it available, lazily
+    if name == "DICTIONARY":
+        return _dictionary()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+
+@functools.lru_cache(maxsize=2**16)
 def is_valid_word(word: str) -> bool:
     """Checks if a word is valid."""
-    return word.upper() in DICTIONARY
+    return word.upper() in _dictionary()
+
+
+class _TrieNode:
+    """Node of the dictionary trie used for move generation."""
+
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.terminal = False
+
+
+@functools.cache
+def _trie() -> _TrieNode:
+    """Builds the dictionary trie once, on first use."""
+    root = _TrieNode()
+    for word in sorted(_dictionary()):
+        node = root
+        for letter in word:
+            child = node.children.get(letter)
+            if child is None:
+                child = node.children[letter] = _TrieNode()
+            node = child
+        node.terminal = True
+    return root
+
+
+# (letter, count unit, count field mask, cross-check mask bit, letter value)
+_RackLetter = Tuple[str, int, int, int, int]
+
+# Bits per letter count in a packed rack; a rack holds at most 7 tiles
+RACK_FIELD_BITS = 4
+
+
+def _pack_rack(rack: List[str]) -> Tuple[int, List[_RackLetter]]:
+    """Packs the rack's letter counts into a single small int.
+
+    Each distinct letter on the rack gets its own RACK_FIELD_BITS-wide count
+    field, so a full rack fits in 28 bits. Taking a tile is a subtraction,
+    which lets the move generator pass the remaining rack down by value
+    instead of updating and restoring shared counts.
+
+    Also returns the distinct letters, in rack order and without blanks,
+    with everything the generator needs per letter computed once so its
+    inner loops only unpack tuples.
+    """
+    letters: List[_RackLetter] = []
+    units: Dict[str, int] = {}
+    for slot, letter in enumerate(dict.fromkeys(t for t in rack if t != "_")):
+        unit = units[letter] = 1 << (RACK_FIELD_BITS * slot)
+        letters.append(
+            (
+                letter,
+                unit,
+                ((1 << RACK_FIELD_BITS) - 1) * unit,
+                1 << (ord(letter) - 65),
+                LETTER_VALUES[letter],
+            )
+        )
+    packed = sum(units[tile] for tile in rack if tile != "_")
+    return packed, letters
+
+
+def _walk_trie(
+    node: _TrieNode,
+    packed: int,
+    letters: List[_RackLetter],
+    prefix: str,
+    out: List[str],
+) -> None:
+    """Collects every word below `node` that the remaining rack can spell.
+
+    Only rack letters that are children of the current node are tried, so a
+    prefix that starts no dictionary word prunes its whole subtree.
+    """
+    for letter, unit, field, _, _ in letters:
+        if not packed & field:
+            continue
+        child = node.children.get(letter)
+        if child is None:
+            continue
+        word = prefix + letter
+        if child.terminal:
+            out.append(word)
+        _walk_trie(child, packed - unit, letters, word, out)
+
+
+def playable_words(rack: List[str]) -> List[str]:
+    """Returns every dictionary word that can be spelled with the rack's tiles."""
+    words: List[str] = []
+    packed, letters = _pack_rack(rack)
+    _walk_trie(_trie(), packed, letters, "", words)
+    return words
+
+
+# Cross-check masks have bit i set when chr(ord("A") + i) may be placed
+ALL_LETTERS_MASK = (1 << 26) - 1
+
+# Per-direction cross-check masks and cross scores; see _compute_cross_checks
+_CrossChecks = Tuple[Tuple[List[int], List[int]], Tuple[List[int], List[int]]]
+
+
+@functools.lru_cache(maxsize=2**16)
+def _cross_check_mask(before: str, after: str) -> int:
+    """Returns the mask of letters L for which before + L + after is a word.
+
+    Cached across calls: successive states in a search share most of their
+    board, so the same fragments are checked again at almost every node.
+    """
+    node = _trie()
+    for letter in before:
+        node = node.children.get(letter)
+        if node is None:
+            return 0
+
+    mask = 0
+    for letter, child in node.children.items():
+        for next_letter in after:
+            child = child.children.get(next_letter)
+            if child is None:
+                break
+        else:
+            if child.terminal:
+                mask |= 1 << (ord(letter) - 65)
+    return mask
 
 
 class Move:
@@ -73,7 +235,8 @@ class Move:
         score: int,
         is_pass: bool = False,
     ):
-        self.tiles_placed = tiles_placed  # List of (row, col, letter)
+        # Tuple of (row, col, letter), so equality and hashing run in C
+        self.tiles_placed = tuple(tiles_placed)
         self.score = score
         self.is_pass = is_pass
 
@@ -89,17 +252,16 @@ class Move:
 
     def __eq__(self, value: "Move"):
         # Two Move objects are equal if all fields are equal
+        if not isinstance(value, Move):
+            return NotImplemented
         return (
-            all(
-                tile1 == tile2
-                for tile1, tile2 in zip(self.tiles_placed, value.tiles_placed)
-            )
+            self.is_pass == value.is_pass
             and self.score == value.score
-            and self.is_pass == value.is_pass
+            and self.tiles_placed == value.tiles_placed
         )
 
     def __hash__(self):
-        return hash((tuple(self.tiles_placed), self.is_pass))
+        return hash((self.tiles_placed, self.is_pass))
 
 
 class ScrabbleState:
@@ -107,18 +269,39 @@ class ScrabbleState:
 
     def __init__(
         self,
-        board: List[List[str]],
+        board: bytearray,
         tile_pool: List[str],
         racks: Dict[int, List[str]],
         current_player: int,
         scores: Dict[int, int],
+        anchors: Optional[Set[int]] = None,
+        zobrist_hash: Optional[int] = None,
     ):
         self.board = board
         self.tile_pool = tile_pool
         self.racks = racks
         self.current_player = current_player
         self.scores = scores
+        # Flat indices of empty squares next to a tile, kept up to date by
+        # apply_move; scanned from the board when not handed over
+        self.anchors = self._scan_anchors(board) if anchors is None else anchors
+        # Zobrist hash of the board and player to move, likewise kept up to date
+        if zobrist_hash is None:
+            zobrist_hash = ZOBRIST_PLAYER_KEY if current_player == 2 else 0
+            for i, code in enumerate(board):
+                if code != EMPTY:
+                    zobrist_hash ^= ZOBRIST_TILE_KEYS[i * ZOBRIST_CODES + code]
+        self.zobrist_hash = zobrist_hash
+        # Cross-checks (see _compute_cross_checks), built on first use. States
+        # made by apply_move get their parent's as a base plus the squares
+        # placed since, so only the affected entries need redoing.
+        self._cross_checks: Optional[_CrossChecks] = None
+        self._cross_base: Optional[_CrossChecks] = None
+        self._cross_placed: Tuple[Tuple[int, int], ...] = ()
         self.passes_in_a_row = 0
+        # Legal moves per player, filled on first request; a state is not
+        # modified once apply_move has returned it
+        self._legal_moves_cache: Dict[int, List[Move]] = {}
 
     def __repr__(self) -> str:
         """Return a readable representation of the Scrabble game state."""
@@ -131,10 +314,10 @@ class ScrabbleState:
             for r in range(BOARD_SIZE):
                 row_str = f"{r:2d} |"
                 for c in range(BOARD_SIZE):
-                    cell = self.board[r][c]
-                    if cell == "":
+                    cell = self.board[r * BOARD_SIZE + c]
+                    if cell == EMPTY:
                         # Show premium squares on empty cells
-                        premium = PREMIUM_BOARD[r][c]
+                        premium = PREMIUM_FLAT[r * BOARD_SIZE + c]
                         if premium == 2:
                             row_str += " ² "  # Double letter
                         elif premium == 3:
@@ -146,7 +329,7 @@ class ScrabbleState:
                         else:
                             row_str += " · "  # Empty
                     else:
-                        row_str += f" {cell} "
+                        row_str += f" {chr(cell + TILE_OFFSET)} "
                 row_str += "|"
                 lines.append(row_str)
             lines.append("   +" + "---" * BOARD_SIZE + "+")
@@ -204,7 +387,7 @@ class ScrabbleState:
     def create_new_game() -> "ScrabbleState":
         """Factory function to create a new Scrabble game with initial setup."""
         # Initialize empty board
-        board = [["" for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+        board = bytearray(BOARD_SIZE * BOARD_SIZE)
 
         # Create tile pool with standard Scrabble distribution
         tile_distribution = {
@@ -264,304 +447,412 @@ class ScrabbleState:
         )
 
     def get_legal_moves(self, player_id: int) -> List[Move]:
+        cached = self._legal_moves_cache.get(player_id)
+        if cached is not None:
+            return cached
+
         if self.is_terminal():
             return []
 
         moves = []
         rack = self.racks[player_id]
 
-        # Check if board is empty (first move)
-        board_empty = all(
-            self.board[r][c] == "" for r in range(BOARD_SIZE) for c in range(BOARD_SIZE)
-        )
+        # Check if board is empty (first move); any() scans the bytearray in C
+        board_empty = not any(self.board)
 
         # If board is empty, only allow moves through center (7, 7)
         if board_empty:
-            moves.extend(self._generate_first_move(rack))
+            moves.extend(self._generate_first_move(playable_words(rack)))
         else:
             # Generate moves that connect to existing tiles
-            moves.extend(self._generate_connected_moves(rack))
+            packed, letters = _pack_rack(rack)
+            moves.extend(self._generate_connected_moves(packed, letters))
 
         # Always allow passing as a move
         moves.append(Move([], 0, is_pass=True))
 
+        self._legal_moves_cache[player_id] = moves
         return moves
 
     # --- BEGIN Game Move Logic ---
 
-    def _generate_first_move(self, rack: List[str]) -> List[Move]:
-        """Generate all valid first moves (must go through center square)."""
+    def _generate_first_move(self, words: List[str]) -> List[Move]:
+        """Generate all valid first moves (must go through center square).
+
+        Only horizontal placements are generated. The premium board is
+        symmetric about its diagonal, so each vertical first move is the
+        mirror image of a horizontal one, scores the same, and leads to a
+        mirrored game.
+        """
         moves = []
         center = 7
 
-        # Try all permutations of rack tiles for horizontal and vertical placements
-
-        for length in range(2, len(rack) + 1):
-            for perm in permutations(rack, length):
-                word = "".join(perm)
-                if not is_valid_word(word):
-                    continue
-
-                # Try horizontal placements through center
-                for start_col in range(
-                    max(0, center - length + 1),
-                    min(center + 1, BOARD_SIZE - length + 1),
-                ):
-                    if start_col <= center < start_col + length:
-                        tiles_placed = [
-                            (center, start_col + i, perm[i]) for i in range(length)
-                        ]
-                        score = self._calculate_score(tiles_placed)
-                        moves.append(Move(tiles_placed, score))
-
-                # Try vertical placements through center
-                for start_row in range(
-                    max(0, center - length + 1),
-                    min(center + 1, BOARD_SIZE - length + 1),
-                ):
-                    if start_row <= center < start_row + length:
-                        tiles_placed = [
-                            (start_row + i, center, perm[i]) for i in range(length)
-                        ]
-                        score = self._calculate_score(tiles_placed)
-                        moves.append(Move(tiles_placed, score))
+        # Try every playable word in horizontal placements
+        for word in words:
+            length = len(word)
+
+            # Try horizontal placements through center
+            for start_col in range(
+                max(0, center - length + 1),
+                min(center + 1, BOARD_SIZE - length + 1),
+            ):
+                if start_col <= center < start_col + length:
+                    tiles_placed = [
+                        (center, start_col + i, word[i]) for i in range(length)
+                    ]
+                    score = self._calculate_score(tiles_placed)
+                    moves.append(Move(tiles_placed, score))
 
         return moves
 
-    def _generate_connected_moves(self, rack: List[str]) -> List[Move]:
+    def _generate_connected_moves(
+        self, packed: int, letters: List[_RackLetter]
+    ) -> List[Move]:
         """Generate all moves that connect to existing tiles on the board."""
         moves = []
 
         # Find all anchor points (empty squares adjacent to filled squares)
         anchors = self._find_anchors()
+        cross_checks, cross_scores = self._get_cross_checks()
 
-        for anchor_row, anchor_col in anchors:
+        for anchor in anchors:
+            anchor_row, anchor_col = divmod(anchor, BOARD_SIZE)
             # Try building words horizontally
             moves.extend(
                 self._build_words_at_anchor(
-                    rack, anchor_row, anchor_col, horizontal=True
+                    packed,
+                    letters,
+                    anchor_row,
+                    anchor_col,
+                    True,
+                    self.anchors,
+                    cross_checks[True],
+                    cross_scores[True],
                 )
             )
             # Try building words vertically
             moves.extend(
                 self._build_words_at_anchor(
-                    rack, anchor_row, anchor_col, horizontal=False
+                    packed,
+                    letters,
+                    anchor_row,
+                    anchor_col,
+                    False,
+                    self.anchors,
+                    cross_checks[False],
+                    cross_scores[False],
                 )
             )
 
         return moves
 
-    def _find_anchors(self) -> List[Tuple[int, int]]:
-        """Find all empty squares adjacent to filled squares."""
-        anchors = []
+    def _find_anchors(self) -> List[int]:
+        """Find all empty squares adjacent to filled squares, in board order."""
+        return sorted(self.anchors)
+
+    @staticmethod
+    def _scan_anchors(board: bytearray) -> Set[int]:
+        """Scan the whole board for empty squares adjacent to filled squares."""
+        anchors = set()
         for r in range(BOARD_SIZE):
             for c in range(BOARD_SIZE):
-                if self.board[r][c] == "":
+                if board[r * BOARD_SIZE + c] == EMPTY:
                     # Check if adjacent to any filled square
-                    adjacent_filled = False
                     for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
                         nr, nc = r + dr, c + dc
                         if 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE:
-                            if self.board[nr][nc] != "":
-                                adjacent_filled = True
+                            if board[nr * BOARD_SIZE + nc] != EMPTY:
+                                anchors.add(r * BOARD_SIZE + c)
                                 break
-                    if adjacent_filled:
-                        anchors.append((r, c))
         return anchors
 
-    def _build_words_at_anchor(
-        self, rack: List[str], anchor_row: int, anchor_col: int, horizontal: bool
-    ) -> List[Move]:
-        """Build all valid words that include the anchor square."""
-        moves = []
-
-        # For each possible word length
-        for word_len in range(2, len(rack) + 1):
-            # For each permutation of tiles
-            for perm in permutations(rack, word_len):
-                word = "".join(perm)
-                if not is_valid_word(word):
+    def _get_cross_checks(self) -> _CrossChecks:
+        """Returns this state's cross-checks, building them on first use."""
+        if self._cross_checks is None:
+            if self._cross_base is None:
+                self._cross_checks = self._compute_cross_checks()
+            else:
+                base_checks, base_scores = self._cross_base
+                checks = (base_checks[0][:], base_checks[1][:])
+                scores = (base_scores[0][:], base_scores[1][:])
+                # A new tile only changes the cross words of the empty squares
+                # just past the ends of its row and column runs
+                board = self.board
+                for row, col in self._cross_placed:
+                    for dr, dc, horizontal in [
+                        (-1, 0, True),
+                        (1, 0, True),
+                        (0, -1, False),
+                        (0, 1, False),
+                    ]:
+                        nr, nc = row + dr, col + dc
+                        while (
+                            0 <= nr < BOARD_SIZE
+                            and 0 <= nc < BOARD_SIZE
+                            and board[nr * BOARD_SIZE + nc] != EMPTY
+                        ):
+                            nr, nc = nr + dr, nc + dc
+                        if 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE:
+                            self._update_cross_check(checks, scores, nr, nc, horizontal)
+                self._cross_checks = (checks, scores)
+            self._cross_base = None
+            self._cross_placed = ()
+        return self._cross_checks
+
+    def _compute_cross_checks(self) -> _CrossChecks:
+        """Compute which letters may be placed on each empty square.
+
+        Returns two pairs of flat (row * BOARD_SIZE + col) lists for vertical
+        and horizontal moves, in that order so they can be indexed by the
+        `horizontal` flag: the masks of allowed letters, and the summed letter
+        values of the cross word's existing tiles. A square with no tiles
+        beside it across the move direction forms no cross word, so every
+        letter is allowed there and its cross score is -1.
+        """
+        checks = (
+            [ALL_LETTERS_MASK] * (BOARD_SIZE * BOARD_SIZE),
+            [ALL_LETTERS_MASK] * (BOARD_SIZE * BOARD_SIZE),
+        )
+        scores = (
+            [-1] * (BOARD_SIZE * BOARD_SIZE),
+            [-1] * (BOARD_SIZE * BOARD_SIZE),
+        )
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                if self.board[r * BOARD_SIZE + c] != EMPTY:
                     continue
+                for horizontal in (False, True):
+                    self._update_cross_check(checks, scores, r, c, horizontal)
+        return checks, scores
 
-                # Try different positions where the anchor is part of the word
-                for anchor_pos_in_word in range(word_len):
-                    if horizontal:
-                        start_col = anchor_col - anchor_pos_in_word
-                        if start_col < 0 or start_col + word_len > BOARD_SIZE:
-                            continue
-
-                        # Build the placement
-                        tiles_placed = []
-                        valid = True
-                        tiles_used_from_rack = []
-
-                        for i in range(word_len):
-                            row, col = anchor_row, start_col + i
-                            if self.board[row][col] == "":
-                                # Need to place a tile here
-                                tiles_placed.append((row, col, perm[i]))
-                                tiles_used_from_rack.append(perm[i])
-                            elif self.board[row][col] == perm[i]:
-                                # Tile already on board matches
-                                continue
-                            else:
-                                # Conflict with existing tile
-                                valid = False
-                                break
-
-                        if not valid or len(tiles_placed) == 0:
-                            continue
-
-                        # Check if we have the tiles in our rack
-                        rack_copy = rack[:]
-                        can_place = True
-                        for tile in tiles_used_from_rack:
-                            if tile in rack_copy:
-                                rack_copy.remove(tile)
-                            else:
-                                can_place = False
-                                break
-
-                        if not can_place:
-                            continue
-
-                        # Validate the complete main word formed (including existing tiles)
-                        temp_board = [row[:] for row in self.board]
-                        for r, c, letter in tiles_placed:
-                            temp_board[r][c] = letter
-                        main_word = self._get_word_at(
-                            temp_board, anchor_row, anchor_col, horizontal=True
-                        )
-                        if not is_valid_word(main_word):
-                            continue
-
-                        # Validate all cross words formed
-                        if self._validate_placement(tiles_placed, horizontal):
-                            score = self._calculate_score(tiles_placed)
-                            moves.append(Move(tiles_placed, score))
-
-                    else:  # vertical
-                        start_row = anchor_row - anchor_pos_in_word
-                        if start_row < 0 or start_row + word_len > BOARD_SIZE:
-                            continue
-
-                        # Build the placement
-                        tiles_placed = []
-                        valid = True
-                        tiles_used_from_rack = []
-
-                        for i in range(word_len):
-                            row, col = start_row + i, anchor_col
-                            if self.board[row][col] == "":
-                                # Need to place a tile here
-                                tiles_placed.append((row, col, perm[i]))
-                                tiles_used_from_rack.append(perm[i])
-                            elif self.board[row][col] == perm[i]:
-                                # Tile already on board matches
-                                continue
-                            else:
-                                # Conflict with existing tile
-                                valid = False
-                                break
-
-                        if not valid or len(tiles_placed) == 0:
-                            continue
-
-                        # Check if we have the tiles in our rack
-                        rack_copy = rack[:]
-                        can_place = True
-                        for tile in tiles_used_from_rack:
-                            if tile in rack_copy:
-                                rack_copy.remove(tile)
-                            else:
-                                can_place = False
-                                break
-
-                        if not can_place:
-                            continue
-
-                        # Validate the complete main word formed (including existing tiles)
-                        temp_board = [row[:] for row in self.board]
-                        for r, c, letter in tiles_placed:
-                            temp_board[r][c] = letter
-                        main_word = self._get_word_at(
-                            temp_board, anchor_row, anchor_col, horizontal=False
-                        )
-                        if not is_valid_word(main_word):
-                            continue
-
-                        # Validate all cross words formed
-                        if self._validate_placement(tiles_placed, horizontal):
-                            score = self._calculate_score(tiles_placed)
-                            moves.append(Move(tiles_placed, score))
-
-        return moves
+    def _update_cross_check(
+        self,
+        checks: Tuple[List[int], List[int]],
+        scores: Tuple[List[int], List[int]],
+        r: int,
+        c: int,
+        horizontal: bool,
+    ) -> None:
+        """Recompute the cross-check entries of one empty square in place."""
+        board = self.board
+        # The cross word runs perpendicular to the move
+        dr, dc = (1, 0) if horizontal else (0, 1)
+        before = ""
+        rr, cc = r - dr, c - dc
+        while rr >= 0 and cc >= 0:
+            code = board[rr * BOARD_SIZE + cc]
+            if code == EMPTY:
+                break
+            before = chr(code + TILE_OFFSET) + before
+            rr, cc = rr - dr, cc - dc
+        after = ""
+        rr, cc = r + dr, c + dc
+        while rr < BOARD_SIZE and cc < BOARD_SIZE:
+            code = board[rr * BOARD_SIZE + cc]
+            if code == EMPTY:
+                break
+            after += chr(code + TILE_OFFSET)
+            rr, cc = rr + dr, cc + dc
+        i = r * BOARD_SIZE + c
+        if before or after:
+            checks[horizontal][i] = _cross_check_mask(before, after)
+            scores[horizontal][i] = sum(
+                LETTER_VALUES[letter] for letter in before + after
+            )
+        else:
+            checks[horizontal][i] = ALL_LETTERS_MASK
+            scores[horizontal][i] = -1
 
-    def _validate_placement(
-        self, tiles_placed: List[Tuple[int, int, str]], horizontal: bool
-    ) -> bool:
-        """Validate that all cross-words formed by placement are valid."""
-        # Create temporary board with new tiles
-        temp_board = [row[:] for row in self.board]
-        for row, col, letter in tiles_placed:
-            temp_board[row][col] = letter
+    def _build_words_at_anchor(
+        self,
+        packed: int,
+        letters: List[_RackLetter],
+        anchor_row: int,
+        anchor_col: int,
+        horizontal: bool,
+        anchors: Set[int],
+        cross_checks: List[int],
+        cross_scores: List[int],
+    ) -> List[Move]:
+        """Build all valid words whose first newly placed tile is the anchor.
+
+        Follows Appel & Jacobson: the part of the word before the anchor is
+        either the tiles already on the board there, or is built from the rack
+        over the free non-anchor squares in front of it. The rest of the word
+        is then extended square by square through the dictionary trie, so a
+        prefix that starts no word is abandoned immediately. Rack letters are
+        only placed where `cross_checks` allows them, so every cross word
+        formed is valid by construction. Each step passes on the remaining
+        `packed` rack (see _pack_rack).
+
+        Scores are accumulated along the walk as well: the main word's letter
+        sum and word multiplier, and the total of the cross words formed, so
+        a finished word is scored without rebuilding the board.
+        """
+        moves = []
 
-        # Check each placed tile for cross-words
-        for row, col, letter in tiles_placed:
+        # Work on the row or column through the anchor as a 1D line, with the
+        # matching slices of the per-square tables
+        if horizontal:
+            line_slice = slice(anchor_row * BOARD_SIZE, (anchor_row + 1) * BOARD_SIZE)
+            anchor = anchor_col
+        else:
+            line_slice = slice(anchor_col, None, BOARD_SIZE)
+            anchor = anchor_row
+        line = self.board[line_slice]
+        line_checks = cross_checks[line_slice]
+        line_cross_scores = cross_scores[line_slice]
+        line_letter_mults = LETTER_MULTIPLIERS[line_slice]
+        line_word_mults = WORD_MULTIPLIERS[line_slice]
+
+        left_part = []  # letters placed from the rack before the anchor
+        right_part = []  # (line position, letter) placed from the anchor on
+
+        def record(word_score, word_multiplier, cross_total):
+            start = anchor - len(left_part)
+            # Left-part tiles are scored here, once their squares are known;
+            # they are not next to any tiles, so they form no cross words
+            for pos, letter in enumerate(left_part, start):
+                word_score += LETTER_VALUES[letter] * line_letter_mults[pos]
+                word_multiplier *= line_word_mults[pos]
+            positions = [
+                (pos, letter) for pos, letter in enumerate(left_part, start)
+            ] + right_part
             if horizontal:
-                # Check vertical cross-word at this position
-                cross_word = self._get_word_at(temp_board, row, col, horizontal=False)
-                if len(cross_word) > 1 and not is_valid_word(cross_word):
-                    return False
+                tiles_placed = [(anchor_row, pos, letter) for pos, letter in positions]
             else:
-                # Check horizontal cross-word at this position
-                cross_word = self._get_word_at(temp_board, row, col, horizontal=True)
-                if len(cross_word) > 1 and not is_valid_word(cross_word):
-                    return False
-
-        return True
-
-    def _get_word_at(
-        self, board: List[List[str]], row: int, col: int, horizontal: bool
-    ) -> str:
-        """Extract the complete word at the given position."""
-        if horizontal:
-            # Find start of word
-            start_col = col
-            while start_col > 0 and board[row][start_col - 1] != "":
-                start_col -= 1
-            # Find end of word
-            end_col = col
-            while end_col < BOARD_SIZE - 1 and board[row][end_col + 1] != "":
-                end_col += 1
-            # Extract word
-            return "".join(board[row][c] for c in range(start_col, end_col + 1))
+                # A single tile with a horizontal neighbor is already generated
+                # (with identical checks) by the horizontal pass
+                anchor_index = anchor_row * BOARD_SIZE + anchor_col
+                if len(positions) == 1 and (
+                    (anchor_col > 0 and self.board[anchor_index - 1] != EMPTY)
+                    or (
+                        anchor_col < BOARD_SIZE - 1
+                        and self.board[anchor_index + 1] != EMPTY
+                    )
+                ):
+                    return
+                tiles_placed = [(pos, anchor_col, letter) for pos, letter in positions]
+                if len(positions) == 1:
+                    # _calculate_score also counts a lone tile as a one-letter
+                    # horizontal word; defer to it to keep scores identical
+                    moves.append(
+                        Move(tiles_placed, self._calculate_score(tiles_placed))
+                    )
+                    return
+
+            score = word_score * word_multiplier + cross_total
+            # Bonus for using all 7 tiles
+            if len(positions) == 7:
+                score += 50
+            moves.append(Move(tiles_placed, score))
+
+        def extend_right(node, pos, packed, word_score, word_multiplier, cross_total):
+            if pos < BOARD_SIZE and line[pos] != EMPTY:
+                # Tile already on board must continue the word, and scores
+                # without a premium
+                letter = chr(line[pos] + TILE_OFFSET)
+                child = node.children.get(letter)
+                if child is not None:
+                    extend_right(
+                        child,
+                        pos + 1,
+                        packed,
+                        word_score + LETTER_VALUES[letter],
+                        word_multiplier,
+                        cross_total,
+                    )
+                return
+
+            # The word ends at an empty square or the edge, past the anchor
+            if node.terminal and pos > anchor:
+                record(word_score, word_multiplier, cross_total)
+            if pos == BOARD_SIZE:
+                return
+
+            allowed = line_checks[pos]
+            cross_score = line_cross_scores[pos]
+            letter_mult = line_letter_mults[pos]
+            word_mult = line_word_mults[pos]
+            for letter, unit, field, bit, value in letters:
+                if not packed & field or not allowed & bit:
+                    continue
+                child = node.children.get(letter)
+                if child is None:
+                    continue
+                letter_score = value * letter_mult
+                right_part.append((pos, letter))
+                extend_right(
+                    child,
+                    pos + 1,
+                    packed - unit,
+                    word_score + letter_score,
+                    word_multiplier * word_mult,
+                    (
+                        cross_total
+                        if cross_score < 0
+                        else cross_total + (cross_score + letter_score) * word_mult
+                    ),
+                )
+                right_part.pop()
+
+        def gen_left(node, limit, packed):
+            # Left-part squares are not anchors, so they have no neighboring
+            # tiles and need no cross-check
+            extend_right(node, anchor, packed, 0, 1, 0)
+            if limit == 0:
+                return
+            for letter, unit, field, _, _ in letters:
+                if not packed & field:
+                    continue
+                child = node.children.get(letter)
+                if child is None:
+                    continue
+                left_part.append(letter)
+                gen_left(child, limit - 1, packed - unit)
+                left_part.pop()
+
+        if anchor > 0 and line[anchor - 1] != EMPTY:
+            # The left part is the word fragment already on the board
+            start = anchor - 1
+            while start > 0 and line[start - 1] != EMPTY:
+                start -= 1
+            node = _trie()
+            word_score = 0
+            for pos in range(start, anchor):
+                letter = chr(line[pos] + TILE_OFFSET)
+                node = node.children.get(letter)
+                if node is None:
+                    return moves
+                word_score += LETTER_VALUES[letter]
+            extend_right(node, anchor, packed, word_score, 1, 0)
         else:
-            # Find start of word
-            start_row = row
-            while start_row > 0 and board[start_row - 1][col] != "":
-                start_row -= 1
-            # Find end of word
-            end_row = row
-            while end_row < BOARD_SIZE - 1 and board[end_row + 1][col] != "":
-                end_row += 1
-            # Extract word
-            return "".join(board[r][col] for r in range(start_row, end_row + 1))
+            # The left part may cover free squares up to the previous anchor,
+            # so every move is generated once, from its first anchor
+            limit = 0
+            pos = anchor - 1
+            while (
+                pos >= 0
+                and line[pos] == EMPTY
+                and (
+                    anchor_row * BOARD_SIZE + pos
+                    if horizontal
+                    else pos * BOARD_SIZE + anchor_col
+                )
+                not in anchors
+                and limit < RACK_SIZE - 1
+            ):
+                limit += 1
+                pos -= 1
+            gen_left(_trie(), limit, packed)
+
+        return moves
 
     def _calculate_score(self, tiles_placed: List[Tuple[int, int, str]]) -> int:
         """Calculate the score for placing these tiles."""
         if not tiles_placed:
             return 0
 
-        # Determine direction of main word
-        if len(tiles_placed) == 1:
-            row, col, letter = tiles_placed[0]
-            # Check if forms horizontal or vertical word with existing tiles
-            horizontal_word = self._get_word_at(self.board, row, col, horizontal=True)
-            vertical_word = self._get_word_at(self.board, row, col, horizontal=False)
-            # For single tile, we need to consider both directions
-            pass
-
         # Assume horizontal if all same row, vertical if all same column
         rows = [r for r, c, l in tiles_placed]
         cols = [c for r, c, l in tiles_placed]
@@ -570,10 +861,12 @@ class ScrabbleState:
         total_score = 0
         word_multiplier = 1
 
-        # Create temp board for scoring
-        temp_board = [row[:] for row in self.board]
+        # Create temp board for scoring, and note which squares are new
+        temp_board = bytearray(self.board)
+        placed = set()
         for row, col, letter in tiles_placed:
-            temp_board[row][col] = letter
+            temp_board[row * BOARD_SIZE + col] = ord(letter) - TILE_OFFSET
+            placed.add(row * BOARD_SIZE + col)
 
         # Score main word
         if horizontal:
@@ -581,26 +874,24 @@ class ScrabbleState:
             start_col = min(cols)
             end_col = max(cols)
             # Extend to include existing tiles
-            while start_col > 0 and temp_board[row][start_col - 1] != "":
+            while (
+                start_col > 0 and temp_board[row * BOARD_SIZE + start_col - 1] != EMPTY
+            ):
                 start_col -= 1
-            while end_col < BOARD_SIZE - 1 and temp_board[row][end_col + 1] != "":
+            while (
+                end_col < BOARD_SIZE - 1
+                and temp_board[row * BOARD_SIZE + end_col + 1] != EMPTY
+            ):
                 end_col += 1
 
             word_score = 0
             for c in range(start_col, end_col + 1):
-                letter = temp_board[row][c]
+                letter = chr(temp_board[row * BOARD_SIZE + c] + TILE_OFFSET)
                 letter_score = LETTER_VALUES.get(letter, 0)
                 # Apply premium if tile was just placed
-                if any(r == row and col == c for r, col, l in tiles_placed):
-                    premium = PREMIUM_BOARD[row][c]
-                    if premium == 2:  # Double letter
-                        letter_score *= 2
-                    elif premium == 3:  # Triple letter
-                        letter_score *= 3
-                    elif premium == 4:  # Double word
-                        word_multiplier *= 2
-                    elif premium == 5:  # Triple word
-                        word_multiplier *= 3
+                if row * BOARD_SIZE + c in placed:
+                    letter_score *= LETTER_MULTIPLIERS[row * BOARD_SIZE + c]
+                    word_multiplier *= WORD_MULTIPLIERS[row * BOARD_SIZE + c]
                 word_score += letter_score
             total_score += word_score * word_multiplier
         else:
@@ -608,77 +899,80 @@ class ScrabbleState:
             start_row = min(rows)
             end_row = max(rows)
             # Extend to include existing tiles
-            while start_row > 0 and temp_board[start_row - 1][col] != "":
+            while (
+                start_row > 0
+                and temp_board[(start_row - 1) * BOARD_SIZE + col] != EMPTY
+            ):
                 start_row -= 1
-            while end_row < BOARD_SIZE - 1 and temp_board[end_row + 1][col] != "":
+            while (
+                end_row < BOARD_SIZE - 1
+                and temp_board[(end_row + 1) * BOARD_SIZE + col] != EMPTY
+            ):
                 end_row += 1
 
             word_score = 0
             for r in range(start_row, end_row + 1):
-                letter = temp_board[r][col]
+                letter = chr(temp_board[r * BOARD_SIZE + col] + TILE_OFFSET)
                 letter_score = LETTER_VALUES.get(letter, 0)
                 # Apply premium if tile was just placed
-                if any(row == r and c == col for row, c, l in tiles_placed):
-                    premium = PREMIUM_BOARD[r][col]
-                    if premium == 2:  # Double letter
-                        letter_score *= 2
-                    elif premium == 3:  # Triple letter
-                        letter_score *= 3
-                    elif premium == 4:  # Double word
-                        word_multiplier *= 2
-                    elif premium == 5:  # Triple word
-                        word_multiplier *= 3
+                if r * BOARD_SIZE + col in placed:
+                    letter_score *= LETTER_MULTIPLIERS[r * BOARD_SIZE + col]
+                    word_multiplier *= WORD_MULTIPLIERS[r * BOARD_SIZE + col]
                 word_score += letter_score
             total_score += word_score * word_multiplier
 
         # Score cross-words
         for row, col, letter in tiles_placed:
             if horizontal:
-                cross_word = self._get_word_at(temp_board, row, col, horizontal=False)
-                if len(cross_word) > 1:
+                # Find the cross-word's extent in a single walk each way
+                start_row = row
+                while (
+                    start_row > 0
+                    and temp_board[(start_row - 1) * BOARD_SIZE + col] != EMPTY
+                ):
+                    start_row -= 1
+                end_row = row
+                while (
+                    end_row < BOARD_SIZE - 1
+                    and temp_board[(end_row + 1) * BOARD_SIZE + col] != EMPTY
+                ):
+                    end_row += 1
+                if end_row > start_row:
                     # Score this cross-word
-                    start_row = row
-                    while start_row > 0 and temp_board[start_row - 1][col] != "":
-                        start_row -= 1
                     cross_score = 0
                     cross_multiplier = 1
-                    for r in range(start_row, start_row + len(cross_word)):
-                        l = temp_board[r][col]
+                    for r in range(start_row, end_row + 1):
+                        l = chr(temp_board[r * BOARD_SIZE + col] + TILE_OFFSET)
                         ls = LETTER_VALUES.get(l, 0)
                         if r == row:  # This is the newly placed tile
-                            premium = PREMIUM_BOARD[r][col]
-                            if premium == 2:
-                                ls *= 2
-                            elif premium == 3:
-                                ls *= 3
-                            elif premium == 4:
-                                cross_multiplier *= 2
-                            elif premium == 5:
-                                cross_multiplier *= 3
+                            ls *= LETTER_MULTIPLIERS[r * BOARD_SIZE + col]
+                            cross_multiplier *= WORD_MULTIPLIERS[r * BOARD_SIZE + col]
                         cross_score += ls
                     total_score += cross_score * cross_multiplier
             else:
-                cross_word = self._get_word_at(temp_board, row, col, horizontal=True)
-                if len(cross_word) > 1:
+                # Find the cross-word's extent in a single walk each way
+                start_col = col
+                while (
+                    start_col > 0
+                    and temp_board[row * BOARD_SIZE + start_col - 1] != EMPTY
+                ):
+                    start_col -= 1
+                end_col = col
+                while (
+                    end_col < BOARD_SIZE - 1
+                    and temp_board[row * BOARD_SIZE + end_col + 1] != EMPTY
+                ):
+                    end_col += 1
+                if end_col > start_col:
                     # Score this cross-word
-                    start_col = col
-                    while start_col > 0 and temp_board[row][start_col - 1] != "":
-                        start_col -= 1
                     cross_score = 0
                     cross_multiplier = 1
-                    for c in range(start_col, start_col + len(cross_word)):
-                        l = temp_board[row][c]
+                    for c in range(start_col, end_col + 1):
+                        l = chr(temp_board[row * BOARD_SIZE + c] + TILE_OFFSET)
                         ls = LETTER_VALUES.get(l, 0)
                         if c == col:  # This is the newly placed tile
-                            premium = PREMIUM_BOARD[row][c]
-                            if premium == 2:
-                                ls *= 2
-                            elif premium == 3:
-                                ls *= 3
-                            elif premium == 4:
-                                cross_multiplier *= 2
-                            elif premium == 5:
-                                cross_multiplier *= 3
+                            ls *= LETTER_MULTIPLIERS[row * BOARD_SIZE + c]
+                            cross_multiplier *= WORD_MULTIPLIERS[row * BOARD_SIZE + c]
                         cross_score += ls
                     total_score += cross_score * cross_multiplier
 
@@ -694,11 +988,13 @@ class ScrabbleState:
         """Creates and returns the next state after the move is applied."""
         opponent_id = 3 - self.current_player
         next_state = ScrabbleState(
-            board=[row[:] for row in self.board],
+            board=bytearray(self.board),
             tile_pool=self.tile_pool[:],
             racks={p: r[:] for p, r in self.racks.items()},
             current_player=opponent_id,  # Switch player
             scores=self.scores.copy(),
+            anchors=set(self.anchors),
+            zobrist_hash=self.zobrist_hash ^ ZOBRIST_PLAYER_KEY,
         )
 
         player_performing_move = self.current_player
@@ -706,7 +1002,30 @@ class ScrabbleState:
         if not move.is_pass:
             # Place tiles on the board
             for row, col, letter in move.tiles_placed:
-                next_state.board[row][col] = letter
+                i = row * BOARD_SIZE + col
+                code = ord(letter) - TILE_OFFSET
+                next_state.board[i] = code
+                next_state.zobrist_hash ^= ZOBRIST_TILE_KEYS[i * ZOBRIST_CODES + code]
+
+            # Only squares around the new tiles can change anchor status
+            for row, col, _ in move.tiles_placed:
+                next_state.anchors.discard(row * BOARD_SIZE + col)
+                for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                    nr, nc = row + dr, col + dc
+                    if 0 <= nr < BOARD_SIZE and 0 <= nc < BOARD_SIZE:
+                        if next_state.board[nr * BOARD_SIZE + nc] == EMPTY:
+                            next_state.anchors.add(nr * BOARD_SIZE + nc)
+
+            # Leave the cross-checks to the first get_legal_moves call, as
+            # most search states never generate moves. Built lists are never
+            # modified, so the nearest ancestor's can be shared as the base.
+            placed = tuple((row, col) for row, col, _ in move.tiles_placed)
+            if self._cross_base is None:
+                next_state._cross_base = self._get_cross_checks()
+                next_state._cross_placed = placed
+            else:
+                next_state._cross_base = self._cross_base
+                next_state._cross_placed = self._cross_placed + placed
 
             # Update score
             next_state.scores[player_performing_move] += move.score
@@ -727,21 +1046,38 @@ class ScrabbleState:
 
             next_state.passes_in_a_row = 0
         else:
+            next_state._cross_checks = self._cross_checks
+            next_state._cross_base = self._cross_base
+            next_state._cross_placed = self._cross_placed
             next_state.passes_in_a_row = self.passes_in_a_row + 1
 
         return next_state
 
     def _draw_tiles(self, count: int) -> List[str]:
         """Draws tiles from the pool (handles stochasticity)."""
-        drawn = []
         # Draw up to 'count' tiles, or until pool is empty
         actual_draw_count = min(count, len(self.tile_pool))
+        # Swap each drawn tile to the end of the pool and pop it, which is
+        # O(1) per tile; the pool's order does not matter
+        pool = self.tile_pool
+        drawn = []
         for _ in range(actual_draw_count):
-            tile = random.choice(self.tile_pool)
-            self.tile_pool.remove(tile)
-            drawn.append(tile)
+            i = random.randrange(len(pool))
+            pool[i], pool[-1] = pool[-1], pool[i]
+            drawn.append(pool.pop())
         return drawn
 
+    def position_key(self) -> Tuple[int, int, bool]:
+        """Returns a hashable key for this position, for transposition tables.
+
+        The racks are left out: apply_move refills them with random draws, so
+        the same board is practically never reached with the same racks, and
+        a search below any state is already a single sample of those draws.
+        Scores are left out too, so searches should store values relative
+        to them.
+        """
+        return (self.zobrist_hash, self.passes_in_a_row, not self.tile_pool)
+
     def is_terminal(self) -> bool:
         """Game ends if tile pool is empty or two consecutive passes occur."""
         return len(self.tile_pool) == 0 or self.passes_in_a_row >= 2
@@ -754,20 +1090,53 @@ class ScrabbleState:
         return self.scores[maximizing_player_id] - self.scores[opponent_id]
 
 
+# Transposition table entry flags: the stored value is exact, or only a
+# lower/upper bound because the search that produced it was cut off
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
+
 class AlphaBetaMinimax:
     """
     Implements a depth-limited Minimax search with Alpha-Beta Pruning.
     Crucial for demonstrating computational limits (high branching factor)
     and conceptual failures.
+
+    The search keeps a transposition table of searched positions, and every
+    node tries the best move stored for its position first, which lets
+    alpha-beta cut off sooner.
     """
 
-    def __init__(self, max_depth: int):
+    def __init__(
+        self,
+        max_depth: int,
+        num_workers: Optional[int] = None,
+        iterative_deepening: bool = False,
+    ):
+        """`num_workers` searches the root moves in that many processes.
+
+        Root moves are then searched independently, without sharing alpha,
+        so this only pays off for searches deep enough to outweigh starting
+        the processes. By default the search runs in this process.
+
+        `iterative_deepening` searches one ply at a time up to `max_depth`,
+        trying the previous iteration's best move first. The extra shallow
+        iterations only tend to pay for themselves from depth 4 on, so it is
+        off by default.
+        """
+        if num_workers is not None and num_workers < 1:
+            raise ValueError("num_workers must be positive")
         self.max_depth = max_depth
+        self.num_workers = num_workers
+        self.iterative_deepening = iterative_deepening
         self.nodes_explored = 0
+        # position_key() -> (depth, value - utility, flag, best move)
+        self.transposition_table: Dict[Tuple, Tuple[int, float, int, Move]] = {}
 
     def find_best_move(self, state: ScrabbleState) -> Move:
         current_player = state.current_player
         self.nodes_explored = 0
+        # Stored values are from the maximizing player's point of view
+        self.transposition_table.clear()
 
         alpha = float("-inf")
         beta = float("inf")
@@ -779,25 +1148,53 @@ class AlphaBetaMinimax:
         if not moves:
             return Move([], 0, is_pass=True)
 
-        start_time = time.time()
+        # Try high-scoring moves first so alpha-beta cuts off more branches
+        moves = sorted(moves, key=lambda move: move.score, reverse=True)
 
-        for move in moves:
-            next_state = state.apply_move(move)
-            # The subsequent layer is the Min player (opponent)
-            value = self._minimax_value(
-                next_state,
-                self.max_depth - 1,
-                alpha,
-                beta,
-                maximizing_player_id=current_player,
-            )
-
-            if value > best_value:
-                best_value = value
-                best_move = move
+        start_time = time.time()
 
-            # Update alpha at the root (Max level)
-            alpha = max(alpha, best_value)
+        if self.num_workers is not None:
+            with ProcessPoolExecutor(max_workers=self.num_workers) as pool:
+                results = pool.map(
+                    _search_root_move,
+                    [(self.max_depth, state, move) for move in moves],
+                )
+                for move, (value, nodes_explored) in zip(moves, results):
+                    self.nodes_explored += nodes_explored
+                    if value > best_value:
+                        best_value = value
+                        best_move = move
+        else:
+            # Apply each root move once, so every iteration searches the same
+            # successors (tile draws are random) and reuses their legal moves
+            children = [(move, state.apply_move(move)) for move in moves]
+            first_depth = 1 if self.iterative_deepening else self.max_depth
+            for depth in range(first_depth, self.max_depth + 1):
+                alpha = float("-inf")
+                best_value = float("-inf")
+                best_child = None
+                for child in children:
+                    move, next_state = child
+                    # The subsequent layer is the Min player (opponent)
+                    value = self._minimax_value(
+                        next_state,
+                        depth - 1,
+                        alpha,
+                        beta,
+                        maximizing_player_id=current_player,
+                    )
+
+                    if value > best_value:
+                        best_value = value
+                        best_child = child
+
+                    # Update alpha at the root (Max level)
+                    alpha = max(alpha, best_value)
+
+                # Search this iteration's best move first on the next one
+                children.remove(best_child)
+                children.insert(0, best_child)
+                best_move = best_child[0]
 
         duration = time.time() - start_time
         print(
@@ -817,44 +1214,97 @@ class AlphaBetaMinimax:
         """Recursive Minimax function with Alpha-Beta pruning."""
         self.nodes_explored += 1
 
+        utility = state.get_utility(maximizing_player_id)
         if depth == 0 or state.is_terminal():
             # Return static evaluation (utility) at cutoff or terminal node
-            return state.get_utility(maximizing_player_id)
+            return utility
+
+        # Reuse a result for this position searched at least this deep. Values
+        # are stored relative to the utility, which depends on the path taken.
+        key = state.position_key()
+        entry = self.transposition_table.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, relative_value, flag, tt_move = entry
+            if entry_depth >= depth:
+                stored_value = relative_value + utility
+                if flag == TT_EXACT:
+                    return stored_value
+                if flag == TT_LOWER:
+                    alpha = max(alpha, stored_value)
+                else:
+                    beta = min(beta, stored_value)
+                if alpha >= beta:
+                    return stored_value
+        original_alpha, original_beta = alpha, beta
 
         current_player_to_move = state.current_player
         is_max_player_turn = current_player_to_move == maximizing_player_id
 
-        moves = state.get_legal_moves(current_player_to_move)
+        moves = sorted(
+            state.get_legal_moves(current_player_to_move),
+            key=lambda move: move.score,
+            reverse=True,
+        )
+        if tt_move is not None and tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
 
+        best_move = None
         if is_max_player_turn:
             value = float("-inf")
             for move in moves:
                 next_state = state.apply_move(move)
-                value = max(
-                    value,
-                    self._minimax_value(
-                        next_state, depth - 1, alpha, beta, maximizing_player_id
-                    ),
+                child_value = self._minimax_value(
+                    next_state, depth - 1, alpha, beta, maximizing_player_id
                 )
+                if child_value > value:
+                    value = child_value
+                    best_move = move
                 alpha = max(alpha, value)
                 if alpha >= beta:
                     break  # Beta cutoff (Pruning)
-            return value
 
         else:  # Min player turn (opponent)
             value = float("inf")
             for move in moves:
                 next_state = state.apply_move(move)
-                value = min(
-                    value,
-                    self._minimax_value(
-                        next_state, depth - 1, alpha, beta, maximizing_player_id
-                    ),
+                child_value = self._minimax_value(
+                    next_state, depth - 1, alpha, beta, maximizing_player_id
                 )
+                if child_value < value:
+                    value = child_value
+                    best_move = move
                 beta = min(beta, value)
                 if alpha >= beta:
                     break  # Alpha cutoff (Pruning)
-            return value
+
+        if value <= original_alpha:
+            flag = TT_UPPER
+        elif value >= original_beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        self.transposition_table[key] = (depth, value - utility, flag, best_move)
+        return value
+
+
+def _search_root_move(args: Tuple[int, ScrabbleState, Move]) -> Tuple[float, int]:
+    """Process pool entry point: the minimax value of one root move.
+
+    Returns the value together with the number of nodes explored for it, so
+    the parent can report the total.
+    """
+    max_depth, state, move = args
+    searcher = AlphaBetaMinimax(max_depth)
+    value = searcher._minimax_value(
+        state.apply_move(move),
+        max_depth - 1,
+        float("-inf"),
+        float("inf"),
+        maximizing_player_id=state.current_player,
+    )
+    return value, searcher.nodes_explored
 
 
 class MonteCarlo:
@@ -863,9 +1313,17 @@ class MonteCarlo:
     This implementation focuses on the Monte Carlo aspect.
     """
 
-    def __init__(self, num_playouts: int, heuristic_fn):
+    def __init__(self, num_playouts: int, heuristic_fn, max_concurrency: int = 8):
+        """`max_concurrency` caps in-flight heuristic_fn calls, e.g. for rate limits.
+
+        Up to that many playouts are evaluated at once, so heuristic_fn must be
+        safe to run concurrently; pass 1 to evaluate them one at a time.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
         self.num_playouts = num_playouts
         self.heuristic_fn = heuristic_fn
+        self.max_concurrency = max_concurrency
 
     async def find_best_move(self, state: ScrabbleState) -> Move:
         """Runs the Monte Carlo simulation to estimate move values."""
@@ -883,20 +1341,30 @@ class MonteCarlo:
             f"Starting MCTS: {playouts_per_move} playouts per move (for {len(moves)} possible moves)..."
         )
 
-        for move in moves:
-            total_value = 0
+        async def playout(move: Move) -> float:
+            next_state = state.apply_move(move)
 
-            # Run simulations (rollouts)
-            for _ in range(playouts_per_move):
-                next_state = state.apply_move(move)
+            # Use the agentic heuristic to evaluate the outcome of the simulation
+            # NOTE: A real MCTS playout runs until terminal state, but here we
+            # use the heuristic to evaluate the strategic value of the immediate successor
+            # state resulting from the move, simulating guidance.
+            return await self.heuristic_fn(next_state, state.current_player)
+
+        # Run simulations (rollouts) from a fixed set of workers pulling from one
+        # shared iterator, so slow heuristics such as LLM calls overlap without
+        # creating every playout up front
+        playouts = (
+            (i, move) for i, move in enumerate(moves) for _ in range(playouts_per_move)
+        )
+        totals = [0.0] * len(moves)
+
+        async def worker() -> None:
+            for i, move in playouts:
+                totals[i] += await playout(move)
 
-                # Use the agentic heuristic to evaluate the outcome of the simulation
-                # NOTE: A real MCTS playout runs until terminal state, but here we
-                # use the heuristic to evaluate the strategic value of the immediate successor
-                # state resulting from the move, simulating guidance.
-                value = await self.heuristic_fn(next_state, state.current_player)
-                total_value += value
+        await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
 
+        for move, total_value in zip(moves, totals):
             avg_value = total_value / playouts_per_move
             move_values[move] = avg_value
 